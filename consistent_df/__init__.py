@@ -4,7 +4,7 @@
 used across multiple modules, promoting code reuse and consistency across multiple modules."""
 
 from .enforce_dtypes import enforce_dtypes
-from .enforce_schema import enforce_schema
+from .enforce_schema import compile_schema, enforce_compiled, enforce_schema, SchemaPlan
 from .nest import nest, unnest
-from .string import df_to_consistent_str
+from .string import df_fingerprint, df_to_consistent_str, df_to_consistent_str_cached
 from .testing import assert_frame_equal
\ No newline at end of file
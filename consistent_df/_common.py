@@ -0,0 +1,17 @@
+"""Private helpers shared by modules of this package."""
+
+import numpy as np
+import pandas as pd
+
+
+def _is_native(dtype) -> bool:
+    """Whether values of this dtype can be compared and sorted directly by NumPy."""
+    return isinstance(dtype, np.dtype) and dtype.kind in "biufmM"
+
+
+def _sorted_codes(values: pd.Series) -> np.ndarray:
+    """Integer codes of `values` in their sorted unique values, with missing
+    values last, so that the codes order like the values themselves."""
+    codes, uniques = pd.factorize(values, sort=True)
+    codes[codes < 0] = len(uniques)
+    return codes
@@ -1,9 +1,137 @@
 """Module to enforce column schemas in pandas DataFrames."""
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import os
 import re
 from typing import Dict
 from zoneinfo import ZoneInfo
+import numpy as np
 import pandas as pd
+from pandas.api.types import is_datetime64_any_dtype, pandas_dtype
+
+
+_DT_RE = re.compile(r"datetime64\[ns(?:,\s*([^\]]+))?\]")
+
+# Minimum number of cells to convert for which columns are converted in parallel
+_PARALLEL_MIN_SIZE = 100_000
+
+
+@lru_cache(maxsize=256)
+def _parse_dt_dtype(dtype: str) -> tuple[bool, ZoneInfo | None]:
+    """Parse a dtype string into (is_datetime, timezone).
+
+    Raises:
+        ValueError: If `dtype` is a datetime dtype other than
+            'datetime64[ns]' or 'datetime64[ns, <timezone>]'.
+    """
+    if not dtype.startswith("datetime64"):
+        return False, None
+    match = _DT_RE.fullmatch(dtype)
+    if match is None:
+        raise ValueError(f"Unknown datetime dtype: '{dtype}'.")
+    timezone = match.group(1)
+    return True, None if timezone is None else ZoneInfo(timezone.strip())
+
+
+@lru_cache(maxsize=64)
+def _pandas_dtype(dtype: str):
+    return pandas_dtype(dtype)
+
+
+@lru_cache(maxsize=64)
+def _empty_series(dtype: str) -> pd.Series:
+    """Empty Series prototype for missing columns. Callers must not modify
+    the result, but may pass it to the DataFrame constructor, which copies."""
+    return pd.Series(dtype=dtype)
+
+
+def _astype(series: pd.Series, dtype: str) -> pd.Series:
+    """Cast a Series to `dtype`, building nullable float arrays directly
+    from NumPy floats."""
+    source, target = series.dtype, _pandas_dtype(dtype)
+    if (
+        isinstance(source, np.dtype) and source.kind == "f"
+        and isinstance(target, (pd.Float32Dtype, pd.Float64Dtype))
+        and target.numpy_dtype == source
+    ):
+        # Build the masked array directly, bypassing the element-wise
+        # validation of astype, which is much slower for floats
+        values = series.to_numpy(copy=True)
+        array = pd.arrays.FloatingArray(values, np.isnan(values))
+        return pd.Series(array, index=series.index, name=series.name)
+    return series.astype(dtype)
+
+
+def _to_datetime(series: pd.Series) -> pd.Series:
+    """Parse strings with the dedicated ISO 8601 parser, falling back to a
+    single inferred format."""
+    if series.dtype == object or isinstance(series.dtype, pd.StringDtype):
+        try:
+            return pd.to_datetime(series, format="ISO8601")
+        except ValueError:
+            pass
+    return pd.to_datetime(series)
+
+
+def _convert_column(
+    col: str, series: pd.Series, dtype: str, is_datetime: bool, timezone: ZoneInfo | None
+) -> pd.Series:
+    """Convert a single column to `dtype`, returns `series` if it already conforms."""
+    if is_datetime:
+        if not is_datetime64_any_dtype(series):
+            try:
+                series = _to_datetime(series)
+            except pd._libs.tslibs.parsing.DateParseError as e:
+                raise type(e)(f"Failed to convert '{col}' to {dtype}: {e}")
+        if series.dt.tz is not None:
+            if series.dt.tz != timezone:
+                series = series.dt.tz_convert(timezone)
+        elif timezone is not None:
+            series = series.dt.tz_localize(timezone)
+        return series
+    try:
+        if series.dtype != _pandas_dtype(dtype):
+            series = _astype(series, dtype)
+    except (TypeError, ValueError) as e:
+        raise type(e)(f"Failed to convert '{col}' to {dtype}: {e}")
+    return series
+
+
+def _convert_columns(data: pd.DataFrame, conversions: list) -> pd.DataFrame:
+    """Convert columns of `data` as specified by a list of
+    (column, dtype, is_datetime, timezone) tuples.
+
+    Column conversions are independent of each other. For large frames, they
+    run in a thread pool, as pandas releases the GIL in most conversions.
+    `data` is not modified; it is returned unchanged if all columns already
+    conform, otherwise a shallow copy with the converted columns is returned.
+    """
+    series = [data[conversion[0]] for conversion in conversions]
+    if len(conversions) < 2 or len(data) * len(conversions) < _PARALLEL_MIN_SIZE:
+        converted = [_convert_column(conversion[0], s, *conversion[1:])
+                     for conversion, s in zip(conversions, series)]
+    else:
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(_convert_column, conversion[0], s, *conversion[1:])
+                       for conversion, s in zip(conversions, series)]
+            converted = [future.result() for future in futures]
+    changed = [(conversion[0], result)
+               for conversion, original, result in zip(conversions, series, converted)
+               if result is not original]
+    if changed:
+        # Only the replaced columns are materialized in the copy
+        data = data.copy(deep=False)
+        for col, result in changed:
+            data[col] = result
+    return data
+
+
+def _add_columns(data: pd.DataFrame, columns: dict) -> pd.DataFrame:
+    """Append `columns` to `data` in a single concatenation rather than one at
+    a time, keeping the name of the column index."""
+    result = pd.concat([data, pd.DataFrame(columns, index=data.index)], axis=1)
+    return result.rename_axis(columns=data.columns.name)
 
 
 def enforce_dtypes(
@@ -49,54 +177,47 @@ def enforce_dtypes(
         0        1      NaN       A
         1        2      NaN       B
     """
+    if not isinstance(data, pd.DataFrame) and data is not None:
+        raise TypeError("Data must be a pandas DataFrame or None.")
+
     if required is None:
         required = {}
     if optional is None:
         optional = {}
 
-    if not isinstance(data, pd.DataFrame) and data is not None:
-        raise TypeError("Data must be a pandas DataFrame or None.")
-
     all_cols = {**required, **optional}
 
     if data is None:
-        data = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in all_cols.items()})
+        data = pd.DataFrame({col: _empty_series(dtype) for col, dtype in all_cols.items()})
     else:
+        missing = {
+            col: _empty_series(dtype) for col, dtype in all_cols.items()
+            if col not in data.columns
+        }
+        if not data.empty:
+            missing_cols = [col for col in required if col in missing]
+            if missing_cols:
+                raise ValueError(f"Data frame is missing required columns: {missing_cols}")
+
         if data.empty:
+            # Replace existing columns of empty frames by empty columns of the
+            # target dtype rather than converting them
+            existing = [col for col in all_cols if col in data.columns]
+            if existing:
+                data = data.copy(deep=False)
+                for col in existing:
+                    data[col] = _empty_series(all_cols[col])
+        else:
+            conversions = []
             for col, dtype in all_cols.items():
-                data[col] = pd.Series(dtype=dtype)
-
-        missing_cols = [col for col in required if col not in data.columns]
-        if missing_cols:
-            raise ValueError(f"Data frame is missing required columns: {missing_cols}")
-
-        for col, dtype in all_cols.items():
-            if col not in data:
-                data[col] = pd.Series(dtype=dtype)
-            else:
-                if dtype.startswith("datetime64"):
-                    if re.fullmatch("datetime64\\[ns\\]", dtype):
-                        timezone = None
-                    elif re.fullmatch("datetime64\\[ns, .+\\]", dtype):
-                        timezone_str = dtype.split(",")[1][:-1].strip()
-                        timezone = ZoneInfo(timezone_str)
-                    else:
-                        raise ValueError(f"Unknown datetime dtype: '{dtype}'.")
-                    try:
-                        data[col] = pd.to_datetime(data[col])
-                    except pd._libs.tslibs.parsing.DateParseError as e:
-                        raise type(e)(f"Failed to convert '{col}' to {dtype}: {e}")
-                    if data[col].dt.tz is None:
-                        data[col] = data[col].dt.tz_localize(timezone)
-                    else:
-                        data[col] = data[col].dt.tz_convert(timezone)
-                else:
-                    try:
-                        data[col] = data[col].astype(dtype)
-                    except (TypeError, ValueError) as e:
-                        raise type(e)(f"Failed to convert '{col}' to {dtype}: {e}")
-
-        if not keep_extra_columns:
+                if col in data:
+                    conversions.append((col, dtype, *_parse_dt_dtype(dtype)))
+            data = _convert_columns(data, conversions)
+
+        if missing:
+            data = _add_columns(data, missing)
+
+        if not keep_extra_columns and not data.columns.isin(list(all_cols)).all():
             data = data[[col for col in data.columns if col in all_cols]]
 
     return data
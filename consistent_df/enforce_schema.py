@@ -1,9 +1,11 @@
 """Module to enforce column schemas in pandas DataFrames."""
 
-import re
+from dataclasses import dataclass
+from functools import lru_cache
 import pandas as pd
 from io import StringIO
 from zoneinfo import ZoneInfo
+from .enforce_dtypes import _add_columns, _convert_columns, _empty_series, _parse_dt_dtype
 
 
 # TODO: remove this rule when Pandas release the 3.0 version with default copy on write
@@ -19,6 +21,27 @@ SCHEMA_CSV = """
 SCHEMA = pd.read_csv(StringIO(SCHEMA_CSV), skipinitialspace=True)
 
 
+@dataclass(frozen=True, slots=True)
+class SchemaPlan:
+    """Schema pre-processed for repeated application with `enforce_compiled`.
+
+    Use `compile_schema` to create a plan from a schema DataFrame.
+
+    Attributes:
+        columns (tuple[str, ...]): Column names in the order of the schema.
+        dtypes (tuple[str, ...]): Data type of each column.
+        is_datetime (tuple[bool, ...]): Whether each column has a datetime dtype.
+        timezones (tuple[ZoneInfo | None, ...]): Timezone of each datetime
+            column, or None for timezone-naive and non-datetime columns.
+        mandatory (frozenset[str]): Names of the required columns.
+    """
+    columns: tuple[str, ...]
+    dtypes: tuple[str, ...]
+    is_datetime: tuple[bool, ...]
+    timezones: tuple[ZoneInfo | None, ...]
+    mandatory: frozenset[str]
+
+
 def enforce_schema(
     data: pd.DataFrame,
     schema: pd.DataFrame,
@@ -69,54 +92,134 @@ def enforce_schema(
         0    AAPL  150.0
         1   GOOGL  2800.0
     """
+    # Fail fast on invalid data before any schema work
+    if not isinstance(data, pd.DataFrame) and data is not None:
+        raise TypeError("Data must be a pandas DataFrame or None.")
+    return enforce_compiled(
+        data, compile_schema(schema),
+        sort_columns=sort_columns, keep_extra_columns=keep_extra_columns,
+    )
+
+
+def compile_schema(schema: pd.DataFrame) -> SchemaPlan:
+    """Validate and pre-process a schema for repeated application.
+
+    Parsing a schema involves validating the schema DataFrame, resolving
+    datetime dtypes and timezones, and collecting the mandatory columns.
+    Plans are cached on the schema content, so compiling an unchanged schema
+    again is cheap. When applying the same schema to many DataFrames, compile
+    it once and pass the plan to `enforce_compiled`.
+
+    Args:
+        schema (pd.DataFrame): A DataFrame defining the schema, see `enforce_schema`.
+
+    Returns:
+        SchemaPlan: The compiled schema.
+
+    Raises:
+        ValueError: If the schema is missing required columns or contains
+            an unknown datetime dtype.
+        TypeError: If the schema is not a pandas DataFrame.
+    """
     if not isinstance(schema, pd.DataFrame):
         raise TypeError("Schema must be a pandas DataFrame.")
+    fingerprint = (tuple(schema.columns), tuple(schema.itertuples(index=False, name=None)))
+    return _compile_schema(fingerprint)
+
+
+def enforce_compiled(
+    data: pd.DataFrame,
+    plan: SchemaPlan,
+    sort_columns: bool = False,
+    keep_extra_columns: bool = False,
+) -> pd.DataFrame:
+    """Enforce a compiled schema on a pandas DataFrame.
+
+    Behaves like `enforce_schema`, but takes a schema compiled with
+    `compile_schema` to avoid re-processing the schema on every call.
+
+    Args:
+        data (pd.DataFrame | None): The DataFrame to validate and adjust.
+        plan (SchemaPlan): The compiled schema.
+        keep_extra_columns (bool): If True, columns that are not listed in the schema are retained.
+        sort_columns (bool): If True, columns are sorted in the order of appearance in the schema.
+
+    Returns:
+        pd.DataFrame: A DataFrame that conforms to the schema.
+
+    Raises:
+        ValueError: If required columns are missing from the input DataFrame.
+        TypeError: If the data is not a pandas DataFrame, or if a data type
+                   conversion fails.
+    """
     if not isinstance(data, pd.DataFrame) and data is not None:
         raise TypeError("Data must be a pandas DataFrame or None.")
-    if "mandatory" not in schema.columns:
-        schema["mandatory"] = True
-    schema = _enforce_schema(schema, SCHEMA)
     if data is None:
-        data = pd.DataFrame(columns=schema["column"])
-    result = _enforce_schema(data=data, schema=schema)
-    if not keep_extra_columns:
-        result = result[result.columns[result.columns.isin(schema["column"])]]
+        data = pd.DataFrame(columns=pd.Index(plan.columns, name="column"))
+    result = _enforce_schema(data=data, plan=plan)
+    schema_cols = list(plan.columns)
+    in_schema = result.columns.isin(schema_cols)
+    # Select columns only if needed, data that already conforms is returned as is
     if sort_columns:
-        cols = (schema["column"].to_list()
-                + data.columns[~data.columns.isin(schema["column"])].to_list())
-        result = result[cols]
+        extra_cols = result.columns[~in_schema].to_list() if keep_extra_columns else []
+        if result.columns.to_list() != schema_cols + extra_cols:
+            result = result.loc[:, schema_cols + extra_cols]
+    elif not keep_extra_columns and not in_schema.all():
+        result = result.loc[:, in_schema]
     return result
 
 
-def _enforce_schema(data: pd.DataFrame, schema: pd.DataFrame) -> pd.DataFrame:
+@lru_cache(maxsize=32)
+def _compile_schema(fingerprint: tuple) -> SchemaPlan:
+    columns, rows = fingerprint
+    schema = pd.DataFrame(list(rows), columns=list(columns))
+    if "mandatory" not in schema.columns:
+        schema["mandatory"] = True
+    schema = _enforce_schema(schema, _SCHEMA_PLAN)
+    return _build_plan(schema)
+
+
+def _build_plan(schema: pd.DataFrame) -> SchemaPlan:
+    # Collect all plan fields in a single pass over plain row tuples
+    columns, dtypes, is_datetime, timezones, mandatory = [], [], [], [], []
+    rows = schema[["column", "dtype", "mandatory"]].itertuples(index=False, name=None)
+    for column, dtype, is_mandatory in rows:
+        parsed = _parse_dt_dtype(dtype)
+        columns.append(column)
+        dtypes.append(dtype)
+        is_datetime.append(parsed[0])
+        timezones.append(parsed[1])
+        if is_mandatory:
+            mandatory.append(column)
+    return SchemaPlan(
+        columns=tuple(columns),
+        dtypes=tuple(dtypes),
+        is_datetime=tuple(is_datetime),
+        timezones=tuple(timezones),
+        mandatory=frozenset(mandatory),
+    )
+
+
+def _enforce_schema(data: pd.DataFrame, plan: SchemaPlan) -> pd.DataFrame:
     if not data.empty:
-        missing_cols = set(schema.query("mandatory")["column"]).difference(data.columns)
+        missing_cols = set(plan.mandatory).difference(data.columns)
         if missing_cols:
             raise ValueError(f"Data frame is missing required columns: {missing_cols}")
 
-    for col, dtype in zip(schema["column"], schema["dtype"]):
-        if col not in data:
-            data[col] = pd.Series(dtype=dtype)
-        else:
-            if dtype.startswith("datetime64"):
-                if re.fullmatch("datetime64\\[ns\\]", dtype):
-                    timezone = None
-                elif re.fullmatch("datetime64\\[ns, .+\\]", dtype):
-                    timezone_str = dtype.split(",")[1][:-1].strip()
-                    timezone = ZoneInfo(timezone_str)
-                else:
-                    raise ValueError(f"Unknown datetime dtype: '{dtype}'.")
-                try:
-                    data[col] = pd.to_datetime(data[col])
-                except pd._libs.tslibs.parsing.DateParseError as e:
-                    raise type(e)(f"Failed to convert '{col}' to {dtype}: {e}")
-                if data[col].dt.tz is None:
-                    data[col] = data[col].dt.tz_localize(timezone)
-                else:
-                    data[col] = data[col].dt.tz_convert(timezone)
-            else:
-                try:
-                    data[col] = data[col].astype(dtype)
-                except (TypeError, ValueError) as e:
-                    raise type(e)(f"Failed to convert '{col}' to {dtype}: {e}")
+    missing = {
+        col: _empty_series(dtype) for col, dtype in zip(plan.columns, plan.dtypes)
+        if col not in data.columns
+    }
+    conversions = [
+        conversion
+        for conversion in zip(plan.columns, plan.dtypes, plan.is_datetime, plan.timezones)
+        if conversion[0] in data
+    ]
+    data = _convert_columns(data, conversions)
+
+    if missing:
+        data = _add_columns(data, missing)
     return data
+
+
+_SCHEMA_PLAN = _build_plan(SCHEMA)
@@ -1,7 +1,10 @@
 """Module for converting nested DataFrames into long format and vice versa."""
 
+from functools import lru_cache
 from typing import List
+import numpy as np
 import pandas as pd
+from ._common import _sorted_codes
 
 
 def nest(df: pd.DataFrame, columns: List[str], key: str = "data") -> pd.DataFrame:
@@ -53,14 +56,23 @@ def nest(df: pd.DataFrame, columns: List[str], key: str = "data") -> pd.DataFram
         return empty_result
 
     group_columns = [col for col in df.columns if col not in columns]
-    grouped = df.groupby(group_columns, dropna=False)
-    nested_dfs = grouped.apply(lambda x: [x[columns].reset_index(drop=True)], include_groups=False)
-    result = pd.DataFrame(grouped[group_columns].first())
-    result[key] = [df[0] for df in nested_dfs.reset_index(drop=True)]
-    return result.reset_index(drop=True)
-
-
-def unnest(df: pd.DataFrame, key: str = "data") -> pd.DataFrame:
+    keys = [_group_key(df[col]) for col in group_columns]
+    indices = list(df.groupby(keys, dropna=False).indices.values())
+    # Slice inner data frames by group positions instead of a per-group apply,
+    # taking directly from the column arrays to bypass DataFrame indexing
+    arrays = {col: df[col].array for col in columns}
+    nested_dfs = [
+        pd.DataFrame({col: array.take(idx) for col, array in arrays.items()}, copy=False)
+        for idx in indices
+    ]
+    # Group columns are constant within each group, take them from the first row
+    first = [idx[0] for idx in indices]
+    outer = df.iloc[first][group_columns].reset_index(drop=True)
+    # Attach the nested column in one concatenation, without inserting into the outer frame
+    return pd.concat([outer, pd.Series(nested_dfs, name=key)], axis=1, copy=False)
+
+
+def unnest(df: pd.DataFrame, key: str = "data", validate: bool = True) -> pd.DataFrame:
     """Expands nested DataFrames into long format.
 
     Unnest expands a specified data frame column that contains a list of
@@ -71,6 +83,9 @@ def unnest(df: pd.DataFrame, key: str = "data") -> pd.DataFrame:
     Args:
         df (pd.DataFrame): The input DataFrame with nested data.
         key (str): The name of the column with the nested DataFrames to unnest. Defaults to 'data'.
+        validate (bool): If True (default), check that the key column exists and
+            contains only DataFrames or None. Trusted callers can pass False to skip
+            these checks; invalid input then fails with less informative errors.
 
     Returns:
         pd.DataFrame: A DataFrame with the nested data flattened into long format.
@@ -95,25 +110,73 @@ def unnest(df: pd.DataFrame, key: str = "data") -> pd.DataFrame:
     if df.empty:
         return df.drop(columns=[key])
 
-    # Check if the key column exists in the DataFrame
-    if key not in df.columns:
-        raise ValueError(f"Key column '{key}' not found in `df`.")
-
-    # Ensure 'key' column contains only DataFrames
-    if not all(isinstance(item, pd.DataFrame) or item is None for item in df[key]):
-        raise ValueError(f"All items in column '{key}' must be DataFrames.")
-
-    df_reset = df.reset_index(drop=True)
-    if all(item is None for item in df[key]):
-        flat_dfs = pd.DataFrame()
-    else:
-        flat_dfs = pd.concat(df_reset[key].to_dict())
-        flat_dfs.index = flat_dfs.index.get_level_values(0)
-
-    result = (
-        df_reset.drop(columns=[key])
-        .join(flat_dfs, how="right", validate="1:m", rsuffix="_nested")
-    )
-    # Restore original index
-    result.index = df.index[result.index]
+    if validate:
+        # Check if the key column exists in the DataFrame
+        if key not in df.columns:
+            raise ValueError(f"Key column '{key}' not found in `df`.")
+
+        # Ensure 'key' column contains only DataFrames, checking each distinct
+        # type once rather than each item
+        types = set(map(type, df[key].to_numpy()))
+        types.discard(type(None))
+        if not all(issubclass(item_type, pd.DataFrame) for item_type in types):
+            raise ValueError(f"All items in column '{key}' must be DataFrames.")
+
+    items = df[key]
+    # Positions of rows with a nested DataFrame, None marks rows without
+    positions = np.flatnonzero(items.notna().to_numpy())
+    if not len(positions):
+        # Without nested frames, the result has no rows but the outer columns
+        return df.drop(columns=[key]).iloc[positions]
+    parts = items.to_numpy()[positions].tolist()
+    lengths = np.fromiter((len(part) for part in parts), dtype=np.intp, count=len(parts))
+    # Position of the outer row for each row of the result
+    rows = np.repeat(positions, lengths)
+
+    # Replicate outer rows positionally, which avoids the index alignment of a join.
+    # The outer rows keep the original index, which the inner rows share.
+    outer = df.drop(columns=[key]).iloc[rows]
+    inner = pd.concat(parts, ignore_index=True, copy=False).set_axis(outer.index)
+    inner_columns = inner.columns
+    collisions = _collisions(tuple(outer.columns), tuple(inner_columns))
+    if collisions is not None:
+        inner_columns = pd.Index([
+            f"{col}_nested" if collides else col
+            for col, collides in zip(inner_columns, collisions)
+        ])
+        duplicates = inner_columns[inner_columns.duplicated()].union(
+            inner_columns.intersection(outer.columns))
+        if len(duplicates):
+            raise ValueError(
+                f"Suffix '_nested' for nested columns results in duplicate columns: "
+                f"{duplicates.tolist()}")
+    result = pd.concat([outer, inner], axis=1, copy=False)
+    # Label columns by appending Index objects rather than renaming the inner frame
+    result.columns = outer.columns.append(inner_columns)
     return result
+
+
+@lru_cache(maxsize=256)
+def _collisions(outer_columns: tuple, inner_columns: tuple) -> tuple | None:
+    """Mask of inner columns whose names collide with outer columns, or None
+    without collisions. Cached, as repeated calls on frames with the same
+    structure check identical column tuples. Equal labels such as 1 and 1.0
+    share cache entries, which is why only the mask and not the labels is
+    cached."""
+    outer = set(outer_columns)
+    mask = tuple(col in outer for col in inner_columns)
+    return mask if any(mask) else None
+
+
+def _group_key(series: pd.Series) -> pd.Series | np.ndarray:
+    """Replace object values by integer codes in the sorted unique values,
+    with missing values last, so that grouping compares integers rather than
+    Python objects while preserving the group order. Categorical values are
+    replaced by their category codes, which keeps missing values as a group."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy(copy=True)
+        codes[codes < 0] = len(series.cat.categories)
+        return codes
+    if series.dtype != object:
+        return series
+    return _sorted_codes(series)
@@ -1,6 +1,26 @@
 """This module provides utilities for handling and manipulating pandas DataFrames."""
 
+from collections import OrderedDict
+import hashlib
+import weakref
+import numpy as np
 import pandas as pd
+from ._common import _is_native, _sorted_codes
+
+
+_CACHE_MAXSIZE = 128
+_cache: OrderedDict = OrderedDict()
+
+
+def _sort_key(series: pd.Series) -> np.ndarray:
+    """Values of `series` in a form that np.lexsort orders like sort_values.
+
+    Other than native NumPy values, e.g. strings, are replaced by their
+    integer codes in the sorted unique values, with missing values last.
+    """
+    if _is_native(series.dtype):
+        return series.to_numpy()
+    return _sorted_codes(series)
 
 
 def df_to_consistent_str(df: pd.DataFrame, index: bool = False) -> str:
@@ -16,5 +36,72 @@ def df_to_consistent_str(df: pd.DataFrame, index: bool = False) -> str:
         str: A string representation of the DataFrame.
     """
     sorted_df = df.reindex(sorted(df.columns), axis=1)
-    sorted_df = sorted_df.sort_values(by=sorted_df.columns.tolist(), na_position="last")
-    return sorted_df.to_csv(index=index, header=True, sep=",").strip()
+    try:
+        keys = [_sort_key(sorted_df.iloc[:, i]) for i in range(len(sorted_df.columns))]
+    except TypeError:
+        # Unhashable or mutually incomparable values
+        keys = None
+    if keys:
+        # np.lexsort uses the last key as primary key and, like sort_values,
+        # places NaN and NaT values last
+        sorted_df = sorted_df.iloc[np.lexsort(keys[::-1])]
+    else:
+        sorted_df = sorted_df.sort_values(by=sorted_df.columns.tolist(), na_position="last")
+    return sorted_df.to_csv(index=index, header=True, sep=",", lineterminator="\n").strip()
+
+
+def df_fingerprint(df: pd.DataFrame, index: bool = False) -> bytes:
+    """Computes a SHA-256 digest of a DataFrame, regardless of the column or
+    row order. This is a compact alternative to `df_to_consistent_str` when
+    only equality of DataFrames matters.
+
+    Unlike the string representation, the digest depends on the dtypes:
+    the same values stored with different dtypes, e.g. 1 as int64 and 1.0 as
+    float64, yield different fingerprints.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to fingerprint.
+        index (bool): If True, include the DataFrame's index in the fingerprint.
+
+    Returns:
+        bytes: A 32-byte digest of the DataFrame.
+    """
+    sorted_df = df.reindex(sorted(df.columns), axis=1)
+    if len(sorted_df.columns) or index:
+        hashes = pd.util.hash_pandas_object(sorted_df, index=index).to_numpy()
+    else:
+        hashes = np.zeros(len(sorted_df), dtype=np.uint64)
+    digest = hashlib.sha256(repr(sorted_df.columns.tolist()).encode())
+    # Sorting the row hashes makes the digest independent of the row order
+    digest.update(np.sort(hashes).tobytes())
+    return digest.digest()
+
+
+def df_to_consistent_str_cached(df: pd.DataFrame, index: bool = False) -> str:
+    """Memoized variant of `df_to_consistent_str`.
+
+    Results are cached per DataFrame object, keyed on the object's identity,
+    columns and shape. This speeds up repeated fingerprinting of the same
+    DataFrames, e.g. when matching many candidates against a fixed target.
+    In-place modifications that preserve columns and shape are not detected,
+    so only use this function with DataFrames that are not mutated.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to be converted to a string.
+        index (bool): If True, include the DataFrame's index in the string representation.
+
+    Returns:
+        str: A string representation of the DataFrame.
+    """
+    key = (id(df), tuple(df.columns), df.shape, index)
+    entry = _cache.get(key)
+    # Verify identity, as ids of garbage-collected DataFrames can be reused
+    if entry is not None and entry[0]() is df:
+        _cache.move_to_end(key)
+        return entry[1]
+
+    result = df_to_consistent_str(df, index=index)
+    _cache[key] = (weakref.ref(df), result)
+    if len(_cache) > _CACHE_MAXSIZE:
+        _cache.popitem(last=False)
+    return result
@@ -1,6 +1,8 @@
 """Module for functions that help in testing."""
 
+import numpy as np
 import pandas as pd
+from ._common import _is_native
 
 
 def assert_frame_equal(
@@ -27,17 +29,89 @@ def assert_frame_equal(
         *args: Additional positional arguments to pass to pandas.testing.assert_frame_equal.
         **kwargs: Additional keyword arguments to pass to pandas.testing.assert_frame_equal.
     """
+    # An object is always equal to itself, regardless of the ignore options
+    if left is right and isinstance(left, pd.DataFrame):
+        return
+
     if ignore_index:
         left = left.reset_index(drop=True)
         right = right.reset_index(drop=True)
 
     if ignore_columns:
-        left = left.drop(columns=ignore_columns, errors="ignore")
-        right = right.drop(columns=ignore_columns, errors="ignore")
+        # Like DataFrame.drop, treat scalars and tuples as a single label
+        if not pd.api.types.is_list_like(ignore_columns) or isinstance(ignore_columns, tuple):
+            ignore_columns = [ignore_columns]
+        left = left.loc[:, ~left.columns.isin(ignore_columns)]
+        right = right.loc[:, ~right.columns.isin(ignore_columns)]
 
     if ignore_row_order:
+        # Align rows by their hash values, which is faster than sorting by all
+        # columns. Rows that compare equal may hash differently, e.g. 0.0 and
+        # -0.0 or values within tolerance, so fall back to sorting on failure.
+        try:
+            _assert_equal(_order_by_hash(left), _order_by_hash(right), *args, **kwargs)
+            return
+        except (AssertionError, TypeError):
+            pass
         common_columns = left.columns.intersection(right.columns).tolist()
         left = left.sort_values(by=common_columns).reset_index(drop=True)
         right = right.sort_values(by=common_columns).reset_index(drop=True)
 
-    pd.testing.assert_frame_equal(left, right, *args, **kwargs)
+    _assert_equal(left, right, *args, **kwargs)
+
+
+def _assert_equal(left: pd.DataFrame, right: pd.DataFrame, *args, **kwargs):
+    """Assert equality with pandas, skipping its checks when a cheap
+    comparison shows that two frames are identical."""
+    if args or kwargs or not _is_identical(left, right):
+        pd.testing.assert_frame_equal(left, right, *args, **kwargs)
+
+
+def _is_identical(left: pd.DataFrame, right: pd.DataFrame) -> bool:
+    """Whether two DataFrames are certainly equal under the default checks
+    of pandas' assert_frame_equal.
+
+    Only handles NumPy-backed numeric, boolean and datetime columns and
+    returns False, i.e. undecided, in all other cases.
+    """
+    if not (
+        isinstance(left, pd.DataFrame) and type(left) is type(right)
+        and left.shape == right.shape
+        and left.flags.allows_duplicate_labels == right.flags.allows_duplicate_labels
+    ):
+        return False
+    for a, b in ((left.index, right.index), (left.columns, right.columns)):
+        if not a.identical(b) or getattr(a, "freq", None) != getattr(b, "freq", None):
+            return False
+    # Compare homogeneous frames in a single pass over all values, which
+    # saves the per-column overhead except for very narrow frames
+    dtypes = set(left.dtypes) if left.shape[1] > 2 else None
+    if dtypes and len(dtypes) == 1 and set(right.dtypes) == dtypes:
+        return _is_native(dtypes.pop()) and _array_equal(left.to_numpy(), right.to_numpy())
+    for (_, a), (_, b) in zip(left.items(), right.items()):
+        if not (_is_native(a.dtype) and a.dtype == b.dtype):
+            return False
+        if not _array_equal(a.to_numpy(), b.to_numpy()):
+            return False
+    return True
+
+
+def _array_equal(a: np.ndarray, b: np.ndarray) -> bool:
+    """Element-wise equality of two arrays of the same dtype, with missing
+    values in the same positions considered equal."""
+    equal = a == b
+    if equal.all():
+        return True
+    if a.dtype.kind == "f":
+        isna = np.isnan
+    elif a.dtype.kind in "mM":
+        isna = np.isnat
+    else:
+        return False
+    return bool((equal | (isna(a) & isna(b))).all())
+
+
+def _order_by_hash(df: pd.DataFrame) -> pd.DataFrame:
+    """Reorder rows by their hash values, so that equal rows line up."""
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return df.iloc[np.argsort(hashes, kind="stable")].reset_index(drop=True)
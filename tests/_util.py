@@ -0,0 +1,24 @@
+"""Helpers shared by the unit tests."""
+
+import numpy as np
+import pandas as pd
+
+
+def _df(**columns) -> pd.DataFrame:
+    """Build a DataFrame from `name=(values, dtype)` pairs, skipping the
+    per-column dtype inference of the DataFrame constructor."""
+    arrays = []
+    for values, dtype in columns.values():
+        if np.dtype(dtype) == object:
+            # Element-wise assignment, as nested sequences such as DataFrames
+            # would otherwise be expanded into additional dimensions
+            array = np.empty(len(values), dtype=object)
+            for i, value in enumerate(values):
+                array[i] = value
+        else:
+            array = np.asarray(values, dtype=dtype)
+        arrays.append(array)
+    n = len(arrays[0]) if arrays else 0
+    return pd.DataFrame._from_arrays(
+        arrays, columns=pd.Index(list(columns)), index=pd.RangeIndex(n)
+    )
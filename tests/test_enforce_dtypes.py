@@ -2,6 +2,7 @@
 
 from zoneinfo import ZoneInfo
 from consistent_df import enforce_dtypes
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -42,6 +43,24 @@ def test_optional_columns_added() -> None:
     assert result["Column2"].dtype == "float64"
 
 
+def test_typed_empty_input() -> None:
+    """Test columns of an empty frame are replaced by empty target columns."""
+    df = pd.DataFrame({"Column1": pd.Series([], dtype="datetime64[ns]")})
+    result = enforce_dtypes(df, required={"Column1": "float64"}, optional={"Column2": "int64"})
+    assert result.empty
+    assert list(result.columns) == ["Column1", "Column2"]
+    assert result["Column1"].dtype == "float64"
+    assert result["Column2"].dtype == "int64"
+
+
+def test_added_columns_keep_column_index_name() -> None:
+    """Test the name of the column index survives adding missing columns."""
+    df = pd.DataFrame({"Column1": [1]}).rename_axis(columns="name")
+    result = enforce_dtypes(df, required={"Column1": "int64"}, optional={"Column2": "float64"})
+    assert list(result.columns) == ["Column1", "Column2"]
+    assert result.columns.name == "name"
+
+
 def test_missing_required_columns() -> None:
     """Test exception when missing required columns."""
     df = pd.DataFrame({"Column3": ["data"]})
@@ -117,6 +136,13 @@ def test_datetime_with_timezone() -> None:
     assert result["Date"].dtype == "datetime64[ns, US/Eastern]"
 
 
+def test_datetime_timezone_with_surrounding_whitespace() -> None:
+    """Test whitespace around the timezone of a datetime dtype is ignored."""
+    df = pd.DataFrame({"Date": ["2021-01-01T12:00:00"]})
+    result = enforce_dtypes(data=df, required={"Date": "datetime64[ns,  UTC ]"})
+    assert result["Date"].dtype == "datetime64[ns, UTC]"
+
+
 def test_datetime_conversion_fail() -> None:
     """Test failure in converting invalid datetime format."""
     df = pd.DataFrame({"Column1": [1], "Date": ["not a date"]})
@@ -126,3 +152,55 @@ def test_datetime_conversion_fail() -> None:
         match="^Failed to convert 'Date' to datetime64\\[ns\\]:",
     ):
         enforce_dtypes(data=df, required=required_columns)
+
+
+def test_datetime_mixed_formats() -> None:
+    """Test datetime strings that do not share a common format are rejected
+    rather than parsed with a different format per element."""
+    for dates in (["2021-01-01", "02/03/2022"], ["01/02/2021", "13/02/2021"]):
+        df = pd.DataFrame({"Date": dates})
+        with pytest.raises(ValueError, match="doesn't match format"):
+            enforce_dtypes(data=df, required={"Date": "datetime64[ns]"})
+
+
+def test_conversion_of_many_large_columns() -> None:
+    """Test a frame large enough for columns to be converted in parallel."""
+    n = 20_000
+    data = {f"Column{i}": [str(j) for j in range(n)] for i in range(10)}
+    data["Date"] = "2021-01-01"
+    df = pd.DataFrame(data)
+    required = {f"Column{i}": "int64" for i in range(10)}
+    required["Date"] = "datetime64[ns, UTC]"
+    result = enforce_dtypes(df, required=required)
+    assert list(result.columns) == list(required)
+    assert (result.dtypes.iloc[:10] == "int64").all()
+    assert result["Date"].dtype == "datetime64[ns, UTC]"
+    assert result["Column9"].equals(pd.Series(np.arange(n), name="Column9"))
+
+    data["Column3"][5] = "invalid"
+    df = pd.DataFrame(data)
+    with pytest.raises(ValueError, match="^Failed to convert 'Column3' to int64:"):
+        enforce_dtypes(df, required=required)
+
+
+def test_float_to_nullable_float_conversion() -> None:
+    """Test casts of float columns to nullable floats, with NaN becoming NA."""
+    df = pd.DataFrame({
+        "Column1": [1.5, np.nan, np.inf],
+        "Column2": np.array([1.0, np.nan, 2.0], dtype="float32"),
+    })
+    result = enforce_dtypes(df, required={"Column1": "Float64", "Column2": "Float32"})
+    pd.testing.assert_series_equal(result["Column1"], df["Column1"].astype("Float64"))
+    pd.testing.assert_series_equal(result["Column2"], df["Column2"].astype("Float32"))
+    assert result["Column1"].isna().tolist() == [False, True, False]
+
+
+def test_input_not_modified() -> None:
+    """Test that conversions leave the input unchanged, and that conforming
+    data is returned without conversion."""
+    df = pd.DataFrame({"Column1": ["1", "2"], "Column2": [1.0, 2.0]})
+    result = enforce_dtypes(df, required={"Column1": "int64", "Column2": "float64"})
+    assert result["Column1"].dtype == "int64"
+    assert df["Column1"].tolist() == ["1", "2"]
+
+    assert enforce_dtypes(result, required={"Column1": "int64", "Column2": "float64"}) is result
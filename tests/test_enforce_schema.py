@@ -1,12 +1,18 @@
 """Unit tests for enforcing DataFrame column schema with enforce_schema()."""
 
+from functools import lru_cache
 from zoneinfo import ZoneInfo
-from consistent_df import enforce_schema
+from consistent_df import compile_schema, enforce_compiled, enforce_schema, SchemaPlan
 import pandas as pd
 import pytest
 from io import StringIO
 
 
+@lru_cache(maxsize=None)
+def _parse_schema(schema_csv: str) -> pd.DataFrame:
+    return pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+
+
 def test_schema_is_not_dataframe():
     df = pd.DataFrame({"Column1": [1, 2]})
     with pytest.raises(TypeError, match="Schema must be a pandas DataFrame."):
@@ -27,7 +33,7 @@ def test_schema_invalid_dtype():
         column,     dtype,    mandatory
         Column1,         ,    True
     """
-    schema = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    schema = _parse_schema(schema_csv).copy()
     with pytest.raises(TypeError):
         enforce_schema(df, schema)
 
@@ -38,7 +44,7 @@ def test_schema_without_mandatory_column():
         ticker,        string[python]
         price,         Float64
     """
-    schema = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    schema = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"ticker": ["AAPL", "GOOGL"]})
 
     with pytest.raises(ValueError, match="Data frame is missing required columns"):
@@ -56,7 +62,7 @@ def test_invalid_data_type():
         column,    dtype,   mandatory
         Column1,   int64,   True
     """
-    schema = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    schema = _parse_schema(schema_csv).copy()
     invalid_data = {"Column1": [1, 2]}  # Using a dictionary instead of DataFrame
     with pytest.raises(TypeError, match="Data must be a pandas DataFrame or None."):
         enforce_schema(invalid_data, schema)
@@ -70,7 +76,7 @@ def test_empty_input():
         Date,               datetime64[ns],       False
         Column3,            object,               False
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     result = enforce_schema(None, SAMPLE_SCHEMA)
     assert isinstance(result, pd.DataFrame)
     assert result.empty
@@ -83,7 +89,7 @@ def test_empty_dataframe():
         Column1,     int64,    True
         Column2,   float64,    False
     """
-    schema = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    schema = _parse_schema(schema_csv).copy()
 
     empty_df = pd.DataFrame()
     result = enforce_schema(empty_df, schema)
@@ -99,7 +105,7 @@ def test_required_columns_added():
         Column1,    int64,     True
         Column2,  float64,     True
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     result = enforce_schema(None, SAMPLE_SCHEMA)
     assert isinstance(result, pd.DataFrame)
     assert result.empty
@@ -114,19 +120,32 @@ def test_optional_columns_added():
         Column1,     int64,   True
         Column2,    float64,  False
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column1": [1]})
     result = enforce_schema(data=df, schema=SAMPLE_SCHEMA)
     assert list(result.columns) == ["Column1", "Column2"]
     assert result["Column2"].dtype == "float64"
 
 
+def test_added_columns_keep_column_index_name():
+    schema_csv = """
+        column,      dtype,   mandatory
+        Column1,     int64,   True
+        Column2,    float64,  False
+    """
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
+    df = pd.DataFrame({"Column1": [1]}).rename_axis(columns="name")
+    result = enforce_schema(data=df, schema=SAMPLE_SCHEMA)
+    assert list(result.columns) == ["Column1", "Column2"]
+    assert result.columns.name == "name"
+
+
 def test_missing_required_columns():
     schema_csv = """
         column,    dtype,     mandatory
         Column1,   int64,     True
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column3": ["data"]})
     with pytest.raises(ValueError):
         enforce_schema(data=df, schema=SAMPLE_SCHEMA)
@@ -137,7 +156,7 @@ def test_keep_extra_columns():
         column,    dtype,     mandatory
         Column1,   int64,     True
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column1": [1], "Column3": ["extra"]})
     result = enforce_schema(data=df, schema=SAMPLE_SCHEMA, keep_extra_columns=False)
     assert "Column3" not in result.columns
@@ -154,7 +173,7 @@ def test_sort_columns():
         ticker,             string[python],       True
         price,              float64,              True
     """
-    schema = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    schema = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({
         'price': [150.0, 2800.0],
         'ticker': ['AAPL', 'GOOGL']
@@ -171,13 +190,33 @@ def test_sort_columns():
     )
 
 
+def test_sort_columns_with_extra_columns():
+    schema_csv = """
+        column,             dtype,                mandatory
+        ticker,             string[python],       True
+        price,              float64,              True
+    """
+    schema = _parse_schema(schema_csv).copy()
+    df = pd.DataFrame({
+        'volume': [100, 200],
+        'price': [150.0, 2800.0],
+        'ticker': ['AAPL', 'GOOGL']
+    })
+
+    result = enforce_schema(df, schema, sort_columns=True, keep_extra_columns=True)
+    assert list(result.columns) == ['ticker', 'price', 'volume']
+
+    result = enforce_schema(df, schema, sort_columns=True, keep_extra_columns=False)
+    assert list(result.columns) == ['ticker', 'price']
+
+
 def test_dtype_conversion():
     schema_csv = """
         column,    dtype,     mandatory
         Column1,   int64,     True
         Column2,   float64,     False
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column1": ["1", "2", "3"], "Column2": ["1.1", "2.2", "3.3"]})
     result = enforce_schema(data=df, schema=SAMPLE_SCHEMA)
     assert result["Column1"].dtype == "int64"
@@ -190,7 +229,7 @@ def test_invalid_dtype_conversion():
         Column1,   int64,     True
         Column2,   float64,   False
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column1": ["invalid"], "Column2": ["data"]})
     with pytest.raises(ValueError, match="^Failed to convert 'Column1' to int64:"):
         enforce_schema(data=df, schema=SAMPLE_SCHEMA)
@@ -202,7 +241,7 @@ def test_datetime_without_timezone():
         Column1,   int64,           True
         Date,      datetime64[ns],  True
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column1": [1, 2], "Date": ["2021-01-01", "2022-02-02"]})
     result = enforce_schema(data=df, schema=SAMPLE_SCHEMA)
     assert pd.to_datetime("2021-01-01") in result["Date"].values
@@ -215,7 +254,7 @@ def test_datetime_with_timezone():
         Column1,   int64,                         True
         Date,      "datetime64[ns, US/Eastern]",  True
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column1": [1], "Date": ["2021-01-01T12:00:00"]})
     result = enforce_schema(data=df, schema=SAMPLE_SCHEMA)
     expected_date = pd.to_datetime("2021-01-01T12:00:00").tz_localize(ZoneInfo("US/Eastern"))
@@ -230,7 +269,7 @@ def test_unknown_datetime_dtype():
         Column1,   int64,                  True
         Date,      datetime64[unknown],    True
     """
-    schema = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    schema = _parse_schema(schema_csv).copy()
 
     with pytest.raises(ValueError, match="Unknown datetime dtype: 'datetime64\\[unknown\\]'."):
         enforce_schema(df, schema)
@@ -245,7 +284,7 @@ def test_datetime_tz_convert():
         Column1,   int64,                          True
         Date,      "datetime64[ns, US/Eastern]",   True
     """
-    schema = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    schema = _parse_schema(schema_csv).copy()
     result = enforce_schema(df, schema)
     expected_date = (
         pd.to_datetime("2021-01-01T12:00:00")
@@ -263,10 +302,40 @@ def test_datetime_conversion_fail():
         Column1,   int64,           True
         Date,      datetime64[ns],  True
     """
-    SAMPLE_SCHEMA = pd.read_csv(StringIO(schema_csv), skipinitialspace=True)
+    SAMPLE_SCHEMA = _parse_schema(schema_csv).copy()
     df = pd.DataFrame({"Column1": [1], "Date": ["not a date"]})
     with pytest.raises(
         pd._libs.tslibs.parsing.DateParseError,
         match="^Failed to convert 'Date' to datetime64\\[ns\\]:",
     ):
         enforce_schema(data=df, schema=SAMPLE_SCHEMA)
+
+
+def test_compile_schema():
+    schema_csv = """
+        column,    dtype,                          mandatory
+        Column1,   int64,                          True
+        Date,      "datetime64[ns, US/Eastern]",   False
+    """
+    schema = _parse_schema(schema_csv).copy()
+    plan = compile_schema(schema)
+    assert isinstance(plan, SchemaPlan)
+    assert plan.columns == ("Column1", "Date")
+    assert plan.is_datetime == (False, True)
+    assert plan.timezones == (None, ZoneInfo("US/Eastern"))
+    assert plan.mandatory == {"Column1"}
+    assert compile_schema(schema.copy()) is plan
+
+    df = pd.DataFrame({"Column1": ["1", "2"], "Extra": ["a", "b"]})
+    pd.testing.assert_frame_equal(
+        enforce_compiled(df, plan, keep_extra_columns=True),
+        enforce_schema(df, schema, keep_extra_columns=True),
+    )
+
+
+def test_compile_schema_does_not_modify_schema():
+    schema = pd.DataFrame({"column": ["Column1"], "dtype": ["int64"]})
+    compile_schema(schema)
+    assert list(schema.columns) == ["column", "dtype"]
+    with pytest.raises(TypeError, match="Schema must be a pandas DataFrame."):
+        compile_schema(None)
@@ -1,27 +1,32 @@
 """Unit tests for the nest function."""
 
+from _util import _df
 from consistent_df import nest, unnest
 import pandas as pd
 import pytest
 
 
-def test_nest_basic():
-    df = pd.DataFrame({
+@pytest.fixture(scope="module")
+def long_df():
+    """Shared input in long format, nest does not modify its input."""
+    return pd.DataFrame({
         "id": [10, 10, 16, 16],
         "text": ["hello", "hello", "world", "world"],
         "sub_id": [33, 33, 20, 16],
         "sub_text": ["test1", "test2", "test3", "test4"]
     })
-    result = nest(df, columns=["sub_id", "sub_text"], key="items")
-    expected_data = {
-        "id": [10, 16],
-        "text": ["hello", "world"],
-        "items": [
-            pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
-            pd.DataFrame({"sub_id": [20, 16], "sub_text": ["test3", "test4"]})
-        ]
-    }
-    expected_df = pd.DataFrame(expected_data)
+
+
+def test_nest_basic(long_df):
+    result = nest(long_df, columns=["sub_id", "sub_text"], key="items")
+    expected_df = _df(
+        id=([10, 16], "int64"),
+        text=(["hello", "world"], object),
+        items=([
+            _df(sub_id=([33, 33], "int64"), sub_text=(["test1", "test2"], object)),
+            _df(sub_id=([20, 16], "int64"), sub_text=(["test3", "test4"], object)),
+        ], object),
+    )
     pd.testing.assert_frame_equal(result, expected_df)
 
 
@@ -50,23 +55,16 @@ def test_nest_with_single_group():
     pd.testing.assert_frame_equal(result, expected_df)
 
 
-def test_nest_with_multiple_groups():
-    df = pd.DataFrame({
-        "id": [10, 10, 16, 16],
-        "text": ["hello", "hello", "world", "world"],
-        "sub_id": [33, 33, 20, 16],
-        "sub_text": ["test1", "test2", "test3", "test4"]
-    })
-    result = nest(df, columns=["sub_id", "sub_text"], key="items")
-    expected_data = {
-        "id": [10, 16],
-        "text": ["hello", "world"],
-        "items": [
-            pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
-            pd.DataFrame({"sub_id": [20, 16], "sub_text": ["test3", "test4"]})
-        ]
-    }
-    expected_df = pd.DataFrame(expected_data)
+def test_nest_with_multiple_groups(long_df):
+    result = nest(long_df, columns=["sub_id", "sub_text"], key="items")
+    expected_df = _df(
+        id=([10, 16], "int64"),
+        text=(["hello", "world"], object),
+        items=([
+            _df(sub_id=([33, 33], "int64"), sub_text=(["test1", "test2"], object)),
+            _df(sub_id=([20, 16], "int64"), sub_text=(["test3", "test4"], object)),
+        ], object),
+    )
     pd.testing.assert_frame_equal(result, expected_df)
 
 
@@ -90,29 +88,33 @@ def test_nest_with_na_grouping_values():
     pd.testing.assert_frame_equal(result, expected_df)
 
 
-def test_successive_nest_and_unnest_results_in_original_df():
-    data = {
-        "id": [10, 10, 16, 16],
-        "text": ["hello", "hello", "world", "world"],
-        "sub_id": [33, 33, 20, 16],
-        "sub_text": ["test1", "test2", "test3", "test4"]
-    }
-    df = pd.DataFrame(data)
-    nested_df = nest(df, columns=["sub_id", "sub_text"])
+def test_nest_with_categorical_grouping_values():
+    categories = ["c", "b", "a"]
+    df = pd.DataFrame({
+        "id": pd.Categorical(["b", "a", "b", None], categories=categories),
+        "sub_id": [1, 2, 3, 4],
+    })
+    result = nest(df, columns=["sub_id"], key="items")
+    expected_df = pd.DataFrame({
+        "id": pd.Categorical(["b", "a", None], categories=categories),
+        "items": [
+            pd.DataFrame({"sub_id": [1, 3]}),
+            pd.DataFrame({"sub_id": [2]}),
+            pd.DataFrame({"sub_id": [4]}),
+        ]
+    })
+    pd.testing.assert_frame_equal(result, expected_df)
+
+
+def test_successive_nest_and_unnest_results_in_original_df(long_df):
+    nested_df = nest(long_df, columns=["sub_id", "sub_text"])
     unnested_df = unnest(nested_df)
-    pd.testing.assert_frame_equal(df, unnested_df.reset_index(drop=True))
+    pd.testing.assert_frame_equal(long_df, unnested_df.reset_index(drop=True))
 
 
-def test_nest_with_missing_columns_raises_error():
-    data = {
-        "id": [10, 10, 16, 16],
-        "text": ["hello", "hello", "world", "world"],
-        "sub_id": [33, 33, 20, 16],
-        "sub_text": ["test1", "test2", "test3", "test4"]
-    }
-    df = pd.DataFrame(data)
+def test_nest_with_missing_columns_raises_error(long_df):
     with pytest.raises(ValueError, match="`columns` missing in df:"):
-        nest(df, columns=["sub_id", "missing_col"], key="items")
+        nest(long_df, columns=["sub_id", "missing_col"], key="items")
 
 
 def test_nest_with_existing_key_column_raises_error():
@@ -1,6 +1,6 @@
-"""This module tests the df_to_consistent_str function."""
+"""This module tests the df_to_consistent_str and df_fingerprint functions."""
 
-from consistent_df import df_to_consistent_str
+from consistent_df import df_fingerprint, df_to_consistent_str, df_to_consistent_str_cached
 import pandas as pd
 
 
@@ -51,3 +51,41 @@ def test_equivalent_content():
         "C": pd.Series([2, 1, 3], dtype=pd.StringDtype())
     })
     assert df_to_consistent_str(df1) == df_to_consistent_str(df2.sample(frac=1))
+
+
+def test_string_columns():
+    df = pd.DataFrame({
+        "B": ["b", None, "a", "b"],
+        "A": pd.Series(["y", "x", pd.NA, "x"], dtype=pd.StringDtype()),
+        "C": [2, 1, 3, 0]
+    })
+    expected = "A,B,C\nx,b,0\nx,,1\ny,b,2\n,a,3"
+    assert df_to_consistent_str(df) == expected
+    assert df_to_consistent_str(df.sample(frac=1)) == expected
+
+
+def test_cached_matches_uncached():
+    df = pd.DataFrame({"B": [3, 1, pd.NA], "A": [1, pd.NA, 2], "C": [2, 1, 3]})
+    expected = df_to_consistent_str(df)
+    assert df_to_consistent_str_cached(df) == expected
+    assert df_to_consistent_str_cached(df) == expected
+    assert df_to_consistent_str_cached(df, index=True) == df_to_consistent_str(df, index=True)
+
+
+def test_cached_distinguishes_dataframes():
+    df1 = pd.DataFrame({"A": [1, 2]})
+    df2 = pd.DataFrame({"A": [3, 4]})
+    assert df_to_consistent_str_cached(df1) == "A\n1\n2"
+    assert df_to_consistent_str_cached(df2) == "A\n3\n4"
+
+
+def test_fingerprint():
+    df1 = pd.DataFrame({"B": [3, 1, pd.NA], "A": [1, pd.NA, 2], "C": ["x", "y", None]})
+    df2 = df1.iloc[[2, 0, 1]][["A", "C", "B"]]
+    assert len(df_fingerprint(df1)) == 32
+    assert df_fingerprint(df1) == df_fingerprint(df2)
+    assert df_fingerprint(df1, index=True) == df_fingerprint(df2, index=True)
+    assert df_fingerprint(df1, index=True) != df_fingerprint(df2.reset_index(drop=True), index=True)
+    assert df_fingerprint(df1) != df_fingerprint(df1.iloc[:2])
+    assert df_fingerprint(df1) != df_fingerprint(df1.rename(columns={"A": "D"}))
+    assert df_fingerprint(pd.DataFrame(index=[1, 2])) != df_fingerprint(pd.DataFrame())
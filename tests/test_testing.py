@@ -11,6 +11,34 @@ def test_assert_frame_equal_basic_equality():
     assert_frame_equal(df1, df2)
 
 
+def test_assert_frame_equal_same_object():
+    df = pd.DataFrame({"A": [1.0, None, 3.0], "B": ["x", "y", None]})
+    assert_frame_equal(df, df)
+    assert_frame_equal(df, df, ignore_row_order=True, ignore_index=True)
+    with pytest.raises(AssertionError):
+        assert_frame_equal(None, None)
+
+
+def test_assert_frame_equal_missing_values_and_dtypes():
+    df = pd.DataFrame({
+        "A": [1.0, None], "B": pd.to_datetime(["2024-01-01", None]), "C": [True, False]
+    })
+    assert_frame_equal(df, df.copy())
+    with pytest.raises(AssertionError):
+        assert_frame_equal(df, df.astype({"A": "float32"}))
+    with pytest.raises(AssertionError):
+        assert_frame_equal(df, df.fillna({"A": 0.0}))
+
+
+def test_assert_frame_equal_wide_frames():
+    df = pd.DataFrame({f"C{i}": [i, i + 1, None] for i in range(5)})
+    assert_frame_equal(df, df.copy())
+    with pytest.raises(AssertionError):
+        assert_frame_equal(df, df.astype({"C3": "float32"}))
+    with pytest.raises(AssertionError):
+        assert_frame_equal(df, df.replace({1.0: 0.0}))
+
+
 def test_assert_frame_equal_different_indices():
     df1 = pd.DataFrame({"A": [1, 2, 3]}, index=[0, 1, 2])
     df2 = pd.DataFrame({"A": [1, 2, 3]}, index=[3, 4, 5])
@@ -25,6 +53,17 @@ def test_assert_frame_equal_ignore_columns():
     assert_frame_equal(df1, df2, ignore_columns=["C"])
 
 
+def test_assert_frame_equal_ignore_single_column_label():
+    df1 = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6], "C": [7, 8, 9]})
+    df2 = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6], "C": [10, 11, 12]})
+    assert_frame_equal(df1, df2, ignore_columns="C")
+    columns = pd.MultiIndex.from_tuples([("A", "x"), ("A", "y"), ("C", "x")])
+    df1.columns, df2.columns = columns, columns
+    assert_frame_equal(df1, df2, ignore_columns=("C", "x"))
+    with pytest.raises(AssertionError):
+        assert_frame_equal(df1, df2, ignore_columns=("A", "x"))
+
+
 def test_assert_frame_equal_ignore_columns_with_inequality():
     df1 = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6], "C": [7, 8, 9]})
     df2 = pd.DataFrame({"A": [1, 2, 3], "B": [4, 5, 6], "C": [10, 11, 12]})
@@ -82,6 +121,12 @@ def test_assert_frame_equal_ignore_row_order_with_duplicates():
     assert_frame_equal(df1, df2, ignore_row_order=True)
 
 
+def test_assert_frame_equal_ignore_row_order_with_tolerance():
+    df1 = pd.DataFrame({"A": [0.0, 1.0, 2.0], "B": ["x", "y", "z"]})
+    df2 = pd.DataFrame({"A": [2.0 + 1e-12, -0.0, 1.0], "B": ["z", "x", "y"]})
+    assert_frame_equal(df1, df2, ignore_row_order=True)
+
+
 def test_assert_frame_equal_ignore_row_order_different_shapes():
     df1 = pd.DataFrame({"A": [1, 2], "B": [4, 5]})
     df2 = pd.DataFrame({"A": [2, 1, 3], "B": [5, 4, 6]})
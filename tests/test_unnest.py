@@ -1,103 +1,204 @@
 """Unit tests for the unnest function."""
 
+from _util import _df
 from consistent_df import nest, unnest
 import pandas as pd
 import pytest
 
 
-def test_unnest_basic():
+def _empty_frame(columns, dtypes):
+    df = pd.DataFrame(columns=columns)
+    return df.astype(dtypes)
+
+
+CASES = [
+    pytest.param(
+        pd.DataFrame({
+            "id": [10, 16],
+            "text": ["hello", "world"],
+            "items": [
+                pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
+                pd.DataFrame({"sub_id": [20, 16], "sub_text": ["test3", "test4"]})
+            ]
+        }),
+        "items",
+        pd.DataFrame({
+            "id": [10, 10, 16, 16],
+            "text": ["hello", "hello", "world", "world"],
+            "sub_id": [33, 33, 20, 16],
+            "sub_text": ["test1", "test2", "test3", "test4"]
+        }, index=[0, 0, 1, 1]),
+        None,
+        id="basic",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10, 16],
+            "text": ["hello", "world"],
+            "items": [
+                pd.DataFrame({"id": [33, 33], "sub_text": ["test1", "test2"]}),
+                pd.DataFrame({"id": [20, 16], "sub_text": ["test3", "test4"]})
+            ]
+        }),
+        "items",
+        pd.DataFrame({
+            "id": [10, 10, 16, 16],
+            "text": ["hello", "hello", "world", "world"],
+            "id_nested": [33, 33, 20, 16],
+            "sub_text": ["test1", "test2", "test3", "test4"]
+        }, index=[0, 0, 1, 1]),
+        None,
+        id="matching_columns_in_inner_and_outer_dfs",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10],
+            "text": ["hello"],
+            "items": [pd.DataFrame(columns=["sub_id", "sub_text"])]
+        }),
+        "items",
+        _empty_frame(["id", "text", "sub_id", "sub_text"], {"id": "int64", "text": "object"}),
+        None,
+        id="empty_nested_dataframe",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10, 16, 42],
+            "text": ["hello", "my", "world"],
+            "items": [
+                pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
+                None,  # None should be handled gracefully
+                pd.DataFrame({"sub_id": [42], "sub_text": ["test42"]})
+            ]
+        }),
+        "items",
+        pd.DataFrame({
+            "id": [10, 10, 42],
+            "text": ["hello", "hello", "world"],
+            "sub_id": [33, 33, 42],
+            "sub_text": ["test1", "test2", "test42"]
+        }, index=[0, 0, 2]),
+        None,
+        id="none_in_key_column",
+    ),
+    pytest.param(
+        pd.DataFrame({"id": [10], "text": ["hello"], "items": [None]}),
+        "items",
+        _df(id=([], "int64"), text=([], object)),
+        None,
+        id="only_none_in_key_columns",
+    ),
+    pytest.param(
+        pd.DataFrame(columns=["id", "text", "items"]),
+        "items",
+        pd.DataFrame(columns=["id", "text"]),
+        None,
+        id="empty_dataframe",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10, 16],
+            "text": ["hello", "world"],
+            "data": [1, 2]  # This should raise an error
+        }),
+        "data",
+        None,
+        "All items in column 'data' must be DataFrames.",
+        id="wrong_type_key_column_raises_error",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10, 16],
+            "text": ["hello", "world"],
+            "test": [
+                pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
+                "not a dataframe"  # This should raise an error
+            ]
+        }),
+        "test",
+        None,
+        "All items in column 'test' must be DataFrames.",
+        id="non_dataframe_objects",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10],
+            "items": [pd.DataFrame({"id": [33], "id_nested": [34]})]
+        }),
+        "items",
+        None,
+        "Suffix '_nested' for nested columns results in duplicate columns",
+        id="renamed_nested_column_collides_with_inner_column",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10],
+            "id_nested": [11],
+            "items": [pd.DataFrame({"id": [33]})]
+        }),
+        "items",
+        None,
+        "Suffix '_nested' for nested columns results in duplicate columns",
+        id="renamed_nested_column_collides_with_outer_column",
+    ),
+    pytest.param(
+        pd.DataFrame({
+            "id": [10, 16],
+            "text": ["hello", "world"],
+            # No 'items' column here
+        }),
+        "items",
+        None,
+        "Key column 'items' not found in `df`.",
+        id="missing_key_column_raises_error",
+    ),
+]
+
+
+@pytest.mark.parametrize("df, key, expected, error", CASES)
+def test_unnest(df, key, expected, error):
+    if error is not None:
+        with pytest.raises(ValueError, match=error):
+            unnest(df, key=key)
+    else:
+        pd.testing.assert_frame_equal(unnest(df, key=key), expected)
+
+
+@pytest.mark.parametrize("df, key, expected", [
+    pytest.param(*case.values[:3], id=case.id) for case in CASES if case.values[3] is None
+])
+def test_unnest_without_validation(df, key, expected):
+    pd.testing.assert_frame_equal(unnest(df, key=key, validate=False), expected)
+
+
+def test_unnest_renames_equal_labels_of_different_types():
+    # Equal labels such as 1 and 1.0 must not share renamed columns across calls
+    for labels in ([1, 2], [1.0, 2.0]):
+        df = pd.DataFrame({
+            labels[0]: [10],
+            "items": [pd.DataFrame({labels[0]: [33], labels[1]: [34]})],
+        })
+        result = unnest(df, key="items")
+        assert result.columns.tolist() == [labels[0], f"{labels[0]}_nested", labels[1]]
+        assert [type(label) for label in result.columns] == [type(labels[0]), str, type(labels[1])]
+
+
+def test_unnest_extension_dtypes():
+    pytest.importorskip("pyarrow")
+    dtypes = {"sub_id": "Int64", "sub_text": "string[pyarrow]"}
     df = pd.DataFrame({
         "id": [10, 16],
-        "text": ["hello", "world"],
-        "items": [
-            pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
-            pd.DataFrame({"sub_id": [20, 16], "sub_text": ["test3", "test4"]})
-        ]
-    })
-    result = unnest(df, key="items")
-    expected_data = {
-        "id": [10, 10, 16, 16],
-        "text": ["hello", "hello", "world", "world"],
-        "sub_id": [33, 33, 20, 16],
-        "sub_text": ["test1", "test2", "test3", "test4"]
-    }
-    expected_df = pd.DataFrame(expected_data, index=[0, 0, 1, 1])
-    pd.testing.assert_frame_equal(result, expected_df)
-
-
-def test_unnest_with_matching_columns_in_inner_and_outer_dfs():
-    df = pd.DataFrame({
-        "id": [10, 16],
-        "text": ["hello", "world"],
         "items": [
-            pd.DataFrame({"id": [33, 33], "sub_text": ["test1", "test2"]}),
-            pd.DataFrame({"id": [20, 16], "sub_text": ["test3", "test4"]})
+            pd.DataFrame({"sub_id": [33, None], "sub_text": ["test1", None]}).astype(dtypes),
+            pd.DataFrame({"sub_id": [20], "sub_text": ["test3"]}).astype(dtypes),
         ]
     })
-    result = unnest(df, key="items")
-    expected_data = {
-        "id": [10, 10, 16, 16],
-        "text": ["hello", "hello", "world", "world"],
-        "id_nested": [33, 33, 20, 16],
-        "sub_text": ["test1", "test2", "test3", "test4"]
-    }
-    expected_df = pd.DataFrame(expected_data, index=[0, 0, 1, 1])
-    pd.testing.assert_frame_equal(result, expected_df)
-
-
-def test_unnest_with_empty_nested_dataframe():
-    df = pd.DataFrame({
-        "id": [10],
-        "text": ["hello"],
-        "items": [pd.DataFrame(columns=["sub_id", "sub_text"])]
-    })
-    result = unnest(df, key="items")
-    expected_df = pd.DataFrame(columns=["id", "text", "sub_id", "sub_text"])
-    expected_df["id"] = expected_df["id"].astype(df["id"].dtype)
-    expected_df["text"] = expected_df["text"].astype(df["text"].dtype)
-    pd.testing.assert_frame_equal(result, expected_df)
-
-
-def test_unnest_with_none_in_key_column():
-    data = {
-        "id": [10, 16, 42],
-        "text": ["hello", "my", "world"],
-        "items": [
-            pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
-            None,  # None should be handled gracefully
-            pd.DataFrame({"sub_id": [42], "sub_text": ["test42"]})
-        ]
-    }
-    df = pd.DataFrame(data)
-    result = unnest(df, key="items")
-    expected_data = {
-        "id": [10, 10, 42],
-        "text": ["hello", "hello", "world"],
-        "sub_id": [33, 33, 42],
-        "sub_text": ["test1", "test2", "test42"]
-    }
-    expected_df = pd.DataFrame(expected_data, index=[0, 0, 2])
-    pd.testing.assert_frame_equal(result, expected_df)
-
-
-def test_unnest_with_only_none_in_key_columns():
-    df = pd.DataFrame({
-        "id": [10],
-        "text": ["hello"],
-        "items": [None]
-    })
-    result = unnest(df, key="items")
-    expected_df = pd.DataFrame(columns=["id", "text"])
-    expected_df["id"] = expected_df["id"].astype(df["id"].dtype)
-    expected_df["text"] = expected_df["text"].astype(df["text"].dtype)
-    pd.testing.assert_frame_equal(result, expected_df)
-
-
-def test_unnest_with_empty_dataframe():
-    df = pd.DataFrame(columns=["id", "text", "items"])
-    result = unnest(df, key="items")
-    expected_df = df.drop(columns=["items"])
-    pd.testing.assert_frame_equal(result, expected_df)
+    expected = pd.DataFrame({
+        "id": [10, 10, 16],
+        "sub_id": [33, None, 20],
+        "sub_text": ["test1", None, "test3"],
+    }, index=[0, 0, 1]).astype(dtypes)
+    pd.testing.assert_frame_equal(unnest(df, key="items"), expected)
 
 
 def test_successive_unnest_and_nest_returns_original_df():
@@ -113,39 +214,3 @@ def test_successive_unnest_and_nest_returns_original_df():
     unnested_df = unnest(df)
     nested_df = nest(unnested_df, columns=["sub_id", "sub_text"])
     pd.testing.assert_frame_equal(df, nested_df)
-
-
-def test_unnest_with_wrong_type_key_column_raises_error():
-    data = {
-        "id": [10, 16],
-        "text": ["hello", "world"],
-        "data": [1, 2]  # This should raise an error
-    }
-    df = pd.DataFrame(data)
-    with pytest.raises(ValueError, match="All items in column 'data' must be DataFrames."):
-        unnest(df)
-
-
-def test_unnest_with_non_dataframe_objects():
-    data = {
-        "id": [10, 16],
-        "text": ["hello", "world"],
-        "test": [
-            pd.DataFrame({"sub_id": [33, 33], "sub_text": ["test1", "test2"]}),
-            "not a dataframe"  # This should raise an error
-        ]
-    }
-    df = pd.DataFrame(data)
-    with pytest.raises(ValueError, match="All items in column 'test' must be DataFrames."):
-        unnest(df, key="test")
-
-
-def test_unnest_with_missing_key_column_raises_error():
-    data = {
-        "id": [10, 16],
-        "text": ["hello", "world"],
-        # No 'items' column here
-    }
-    df = pd.DataFrame(data)
-    with pytest.raises(ValueError, match="Key column 'items' not found in `df`."):
-        unnest(df, key="items")